@@ -2,7 +2,9 @@ from ophyd import Component, Device, EpicsMotor, EpicsSignalRO
 
 
 class EpicsMotorWithMRES(EpicsMotor):
-    motor_resolution: EpicsSignalRO = Component(EpicsSignalRO, ".MRES")
+    motor_resolution: EpicsSignalRO = Component(
+        EpicsSignalRO, ".MRES", auto_monitor=True
+    )
 
 
 class Aperture(Device):
@@ -1,12 +1,13 @@
-from dataclasses import dataclass
-from typing import Optional, Tuple
+from dataclasses import dataclass, field
+from typing import FrozenSet, Optional, Tuple
 
 from ophyd import Component as Cpt
-from ophyd.status import AndStatus
+from ophyd.status import StatusBase
 
 from dodal.devices.aperture import Aperture
 from dodal.devices.logging_ophyd_device import InfoLoggingDevice
 from dodal.devices.scatterguard import Scatterguard
+from dodal.devices.status import run_after
 from dodal.log import LOGGER
 
 
@@ -14,7 +15,17 @@ class InvalidApertureMove(Exception):
     pass
 
 
-@dataclass
+# The GDA beamline parameters are named "{axis}_{suffix}", e.g. miniap_x_LARGE_APERTURE
+GDA_AXES = ("miniap_x", "miniap_y", "miniap_z", "sg_x", "sg_y")
+GDA_POSITION_SUFFIXES = {
+    "LARGE": "LARGE_APERTURE",
+    "MEDIUM": "MEDIUM_APERTURE",
+    "SMALL": "SMALL_APERTURE",
+    "ROBOT_LOAD": "ROBOT_LOAD",
+}
+
+
+@dataclass(frozen=True)
 class AperturePositions:
     """Holds tuples (miniap_x, miniap_y, miniap_z, scatterguard_x, scatterguard_y)
     representing the motor positions needed to select a particular aperture size.
@@ -25,46 +36,33 @@ class AperturePositions:
     SMALL: Tuple[float, float, float, float, float]
     ROBOT_LOAD: Tuple[float, float, float, float, float]
 
+    _valid_positions: FrozenSet[Tuple[float, float, float, float, float]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        for position in GDA_POSITION_SUFFIXES:
+            object.__setattr__(self, position, tuple(getattr(self, position)))
+        object.__setattr__(
+            self,
+            "_valid_positions",
+            frozenset((self.LARGE, self.MEDIUM, self.SMALL, self.ROBOT_LOAD)),
+        )
+
     @classmethod
     def from_gda_beamline_params(cls, params):
         return cls(
-            LARGE=(
-                params["miniap_x_LARGE_APERTURE"],
-                params["miniap_y_LARGE_APERTURE"],
-                params["miniap_z_LARGE_APERTURE"],
-                params["sg_x_LARGE_APERTURE"],
-                params["sg_y_LARGE_APERTURE"],
-            ),
-            MEDIUM=(
-                params["miniap_x_MEDIUM_APERTURE"],
-                params["miniap_y_MEDIUM_APERTURE"],
-                params["miniap_z_MEDIUM_APERTURE"],
-                params["sg_x_MEDIUM_APERTURE"],
-                params["sg_y_MEDIUM_APERTURE"],
-            ),
-            SMALL=(
-                params["miniap_x_SMALL_APERTURE"],
-                params["miniap_y_SMALL_APERTURE"],
-                params["miniap_z_SMALL_APERTURE"],
-                params["sg_x_SMALL_APERTURE"],
-                params["sg_y_SMALL_APERTURE"],
-            ),
-            ROBOT_LOAD=(
-                params["miniap_x_ROBOT_LOAD"],
-                params["miniap_y_ROBOT_LOAD"],
-                params["miniap_z_ROBOT_LOAD"],
-                params["sg_x_ROBOT_LOAD"],
-                params["sg_y_ROBOT_LOAD"],
-            ),
+            **{
+                position: tuple(params[f"{axis}_{suffix}"] for axis in GDA_AXES)
+                for position, suffix in GDA_POSITION_SUFFIXES.items()
+            }
         )
 
     def position_valid(self, pos: Tuple[float, float, float, float, float]):
         """
         Check if argument 'pos' is a valid position in this AperturePositions object.
         """
-        if pos not in [self.LARGE, self.MEDIUM, self.SMALL, self.ROBOT_LOAD]:
-            return False
-        return True
+        return tuple(pos) in self._valid_positions
 
 
 class ApertureScatterguard(InfoLoggingDevice):
@@ -72,18 +70,26 @@ class ApertureScatterguard(InfoLoggingDevice):
     scatterguard: Scatterguard = Cpt(Scatterguard, "-MO-SCAT-01:")
     aperture_positions: Optional[AperturePositions] = None
     APERTURE_Z_TOLERANCE = 3  # Number of MRES steps
+    # The second group of motors is started from a callback, so keep hold of the move
+    # to stop another set() overtaking it
+    _move_status: Optional[StatusBase] = None
 
     def load_aperture_positions(self, positions: AperturePositions):
         LOGGER.info(f"{self.name} loaded in {positions}")
         self.aperture_positions = positions
 
-    def set(self, pos: Tuple[float, float, float, float, float]) -> AndStatus:
+    def set(self, pos: Tuple[float, float, float, float, float]) -> StatusBase:
         try:
             assert isinstance(self.aperture_positions, AperturePositions)
             assert self.aperture_positions.position_valid(pos)
         except AssertionError as e:
             raise InvalidApertureMove(repr(e))
-        return self._safe_move_within_datacollection_range(*pos)
+        if self._move_status is not None and not self._move_status.done:
+            raise InvalidApertureMove(
+                f"{self.name} cannot start a new move until {self._move_status} is done"
+            )
+        self._move_status = self._safe_move_within_datacollection_range(*pos)
+        return self._move_status
 
     def _safe_move_within_datacollection_range(
         self,
@@ -92,11 +98,13 @@ class ApertureScatterguard(InfoLoggingDevice):
         aperture_z: float,
         scatterguard_x: float,
         scatterguard_y: float,
-    ) -> AndStatus:
+    ) -> StatusBase:
         """
         Move the aperture and scatterguard combo safely to a new position.
         See https://github.com/DiamondLightSource/python-artemis/wiki/Aperture-Scatterguard-Collisions
-        for why this is required.
+        for why this is required. The second group of motors is only started once
+        the first has finished but this does not block, so other moves can carry on
+        in the meantime.
         """
         # EpicsMotor does not have deadband/MRES field, so the way to check if we are
         # in a datacollection position is to see if we are "ready" (DMOV) and the target
@@ -113,30 +121,22 @@ class ApertureScatterguard(InfoLoggingDevice):
                 f"Current aperture z ({current_ap_z}), outside of tolerance ({tolerance}) from target ({aperture_z})."
             )
 
-        current_ap_y = self.aperture.y.user_readback.get()
-        if aperture_y > current_ap_y:
-            sg_status: AndStatus = self.scatterguard.x.set(
-                scatterguard_x
-            ) & self.scatterguard.y.set(scatterguard_y)
-            sg_status.wait()
-            final_status = (
-                sg_status
-                & self.aperture.x.set(aperture_x)
-                & self.aperture.y.set(aperture_y)
-                & self.aperture.z.set(aperture_z)
+        def move_scatterguard() -> StatusBase:
+            return self.scatterguard.x.set(scatterguard_x) & self.scatterguard.y.set(
+                scatterguard_y
             )
-            return final_status
 
-        else:
-            ap_status: AndStatus = (
+        def move_aperture() -> StatusBase:
+            return (
                 self.aperture.x.set(aperture_x)
                 & self.aperture.y.set(aperture_y)
                 & self.aperture.z.set(aperture_z)
             )
-            ap_status.wait()
-            final_status = (
-                ap_status
-                & self.scatterguard.x.set(scatterguard_x)
-                & self.scatterguard.y.set(scatterguard_y)
-            )
-            return final_status
+
+        current_ap_y = self.aperture.y.user_readback.get()
+        first_move, second_move = (
+            (move_scatterguard, move_aperture)
+            if aperture_y > current_ap_y
+            else (move_aperture, move_scatterguard)
+        )
+        return run_after(first_move(), second_move)
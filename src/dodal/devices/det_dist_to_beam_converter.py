@@ -1,4 +1,6 @@
+import os
 from enum import Enum
+from functools import lru_cache
 
 from numpy import interp, loadtxt
 
@@ -8,6 +10,15 @@ class Axis(Enum):
     Y_AXIS = 2
 
 
+@lru_cache(maxsize=8)
+def _load_lookup_table(lookup_file: str, modified_time_ns: int) -> tuple:
+    """Parses the lookup table into columns, cached so that the many DetectorParams
+    sharing a lookup file only read it once. The modification time is part of the key
+    so that the table is read again if the file changes."""
+    rows = loadtxt(lookup_file, delimiter=" ", comments=["#", "Units"])
+    return tuple(zip(*rows))
+
+
 class DetectorDistanceToBeamXYConverter:
     lookup_file: str
     lookup_table_values: list
@@ -46,10 +57,9 @@ class DetectorDistanceToBeamXYConverter:
         )
 
     def reload_lookup_table(self):
+        _load_lookup_table.cache_clear()
         self.lookup_table_values = self.parse_table()
 
     def parse_table(self) -> list:
-        rows = loadtxt(self.lookup_file, delimiter=" ", comments=["#", "Units"])
-        columns = list(zip(*rows))
-
-        return columns
+        modified_time_ns = os.stat(self.lookup_file).st_mtime_ns
+        return list(_load_lookup_table(self.lookup_file, modified_time_ns))
@@ -1,13 +1,13 @@
 from enum import Enum
 from typing import Optional
 
-from ophyd import Component, Device, EpicsSignalRO
+from ophyd import ADComponent, Component, Device, EpicsSignalRO, EpicsSignalWithRBV
 from ophyd.areadetector.cam import EigerDetectorCam
-from ophyd.status import AndStatus, Status, SubscriptionStatus
+from ophyd.status import Status, StatusBase, SubscriptionStatus
 
 from dodal.devices.detector import DetectorParams, TriggerMode
 from dodal.devices.eiger_odin import EigerOdin
-from dodal.devices.status import await_value
+from dodal.devices.status import all_of, await_value, set_all
 from dodal.log import LOGGER
 
 FREE_RUN_MAX_IMAGES = 1000000
@@ -20,12 +20,23 @@ class InternalEigerTriggerMode(Enum):
     EXTERNAL_ENABLE = 3
 
 
+class EigerDetectorCamWithMonitoredEnergy(EigerDetectorCam):
+    # Read on every stage to check if the threshold needs setting but rarely changes
+    photon_energy: EpicsSignalWithRBV = ADComponent(
+        EpicsSignalWithRBV, "PhotonEnergy", auto_monitor=True
+    )
+
+
 class EigerDetector(Device):
-    cam: EigerDetectorCam = Component(EigerDetectorCam, "CAM:")
+    cam: EigerDetectorCam = Component(EigerDetectorCamWithMonitoredEnergy, "CAM:")
     odin: EigerOdin = Component(EigerOdin, "")
 
-    stale_params: EpicsSignalRO = Component(EpicsSignalRO, "CAM:StaleParameters_RBV")
-    bit_depth: EpicsSignalRO = Component(EpicsSignalRO, "CAM:BitDepthImage_RBV")
+    stale_params: EpicsSignalRO = Component(
+        EpicsSignalRO, "CAM:StaleParameters_RBV", auto_monitor=True
+    )
+    bit_depth: EpicsSignalRO = Component(
+        EpicsSignalRO, "CAM:BitDepthImage_RBV", auto_monitor=True
+    )
 
     STALE_PARAMS_TIMEOUT = 60
 
@@ -33,6 +44,12 @@ class EigerDetector(Device):
 
     detector_params: Optional[DetectorParams] = None
 
+    @property
+    def params(self) -> DetectorParams:
+        if self.detector_params is None:
+            raise Exception("Parameters for scan must be specified")
+        return self.detector_params
+
     @classmethod
     def with_params(
         cls,
@@ -71,13 +88,16 @@ class EigerDetector(Device):
         status_ok, error_message = self.odin.check_odin_initialised()
         if not status_ok:
             raise Exception(f"Odin not initialised: {error_message}")
-        if self.detector_params.use_roi_mode:
+        params = self.params
+        if params.use_roi_mode:
             self.enable_roi_mode()
-        status = self.set_detector_threshold(self.detector_params.current_energy)
-        status &= self.set_cam_pvs()
-        status &= self.set_odin_pvs()
-        status &= self.set_mx_settings_pvs()
-        status &= self.set_num_triggers_and_captures()
+        status = all_of(
+            self.set_detector_threshold(params.current_energy),
+            self.set_cam_pvs(),
+            self.set_odin_pvs(),
+            self.set_mx_settings_pvs(),
+            self.set_num_triggers_and_captures(),
+        )
 
         LOGGER.info("Waiting on parameter callbacks")
         status.wait(self.STALE_PARAMS_TIMEOUT)
@@ -85,13 +105,13 @@ class EigerDetector(Device):
         self.arm_detector()
 
     def unstage(self) -> bool:
-        assert self.detector_params is not None
-        if self.detector_params.trigger_mode == TriggerMode.FREE_RUN:
+        params = self.params
+        if params.trigger_mode == TriggerMode.FREE_RUN:
             # In free run mode we have to wait on all frames being complete and stop odin
             LOGGER.info("Waiting on all frames")
             await_value(
                 self.odin.file_writer.num_captured,
-                self.detector_params.full_number_of_images,
+                params.full_number_of_images,
             ).wait(30)
             LOGGER.info("Stopping Odin")
             self.odin.stop().wait(5)
@@ -111,62 +131,67 @@ class EigerDetector(Device):
         self.change_roi_mode(False)
 
     def change_roi_mode(self, enable: bool):
-        assert self.detector_params is not None
+        params = self.params
         detector_dimensions = (
-            self.detector_params.detector_size_constants.roi_size_pixels
+            params.detector_size_constants.roi_size_pixels
             if enable
-            else self.detector_params.detector_size_constants.det_size_pixels
+            else params.detector_size_constants.det_size_pixels
         )
 
-        status = self.cam.roi_mode.set(1 if enable else 0)
-        status &= self.odin.file_writer.image_height.set(detector_dimensions.height)
-        status &= self.odin.file_writer.image_width.set(detector_dimensions.width)
-        status &= self.odin.file_writer.num_row_chunks.set(detector_dimensions.height)
-        status &= self.odin.file_writer.num_col_chunks.set(detector_dimensions.width)
+        file_writer = self.odin.file_writer
+        status = set_all(
+            (self.cam.roi_mode, 1 if enable else 0),
+            (file_writer.image_height, detector_dimensions.height),
+            (file_writer.image_width, detector_dimensions.width),
+            (file_writer.num_row_chunks, detector_dimensions.height),
+            (file_writer.num_col_chunks, detector_dimensions.width),
+        )
 
         status.wait(10)
 
         if not status.success:
             self.log.error("Failed to switch to ROI mode")
 
-    def set_cam_pvs(self) -> AndStatus:
-        assert self.detector_params is not None
-        status = self.cam.acquire_time.set(self.detector_params.exposure_time)
-        status &= self.cam.acquire_period.set(self.detector_params.exposure_time)
-        status &= self.cam.num_exposures.set(1)
-        status &= self.cam.image_mode.set(self.cam.ImageMode.MULTIPLE)
-        status &= self.cam.trigger_mode.set(
-            InternalEigerTriggerMode.EXTERNAL_SERIES.value
+    def set_cam_pvs(self) -> StatusBase:
+        params = self.params
+        cam = self.cam
+        return set_all(
+            (cam.acquire_time, params.exposure_time),
+            (cam.acquire_period, params.exposure_time),
+            (cam.num_exposures, 1),
+            (cam.image_mode, cam.ImageMode.MULTIPLE),
+            (cam.trigger_mode, InternalEigerTriggerMode.EXTERNAL_SERIES.value),
         )
-        return status
-
-    def set_odin_pvs(self) -> AndStatus:
-        assert self.detector_params is not None
-        self.odin.file_writer.num_frames_chunks.set(1).wait(10)
 
-        file_prefix = self.detector_params.full_filename
+    def set_odin_pvs(self) -> StatusBase:
+        params = self.params
+        file_writer = self.odin.file_writer
+        file_prefix = params.full_filename
 
-        odin_status = self.odin.file_writer.file_path.set(
-            self.detector_params.directory
+        odin_status = set_all(
+            (file_writer.num_frames_chunks, 1),
+            (file_writer.file_path, params.directory),
+            (file_writer.file_name, file_prefix),
         )
-        odin_status &= self.odin.file_writer.file_name.set(file_prefix)
 
         odin_status &= await_value(self.odin.meta.file_name, file_prefix)
-        odin_status &= await_value(self.odin.file_writer.id, file_prefix)
+        odin_status &= await_value(file_writer.id, file_prefix)
 
         return odin_status
 
-    def set_mx_settings_pvs(self) -> AndStatus:
-        assert self.detector_params is not None
-        beam_x_pixels, beam_y_pixels = self.detector_params.get_beam_position_pixels(
-            self.detector_params.detector_distance
+    def set_mx_settings_pvs(self) -> StatusBase:
+        params = self.params
+        cam = self.cam
+        beam_x_pixels, beam_y_pixels = params.get_beam_position_pixels(
+            params.detector_distance
+        )
+        return set_all(
+            (cam.beam_center_x, beam_x_pixels),
+            (cam.beam_center_y, beam_y_pixels),
+            (cam.det_distance, params.detector_distance),
+            (cam.omega_start, params.omega_start),
+            (cam.omega_incr, params.omega_increment),
         )
-        status = self.cam.beam_center_x.set(beam_x_pixels)
-        status &= self.cam.beam_center_y.set(beam_y_pixels)
-        status &= self.cam.det_distance.set(self.detector_params.detector_distance)
-        status &= self.cam.omega_start.set(self.detector_params.omega_start)
-        status &= self.cam.omega_incr.set(self.detector_params.omega_increment)
-        return status
 
     def set_detector_threshold(self, energy: float, tolerance: float = 0.1) -> Status:
         """Ensures the energy threshold on the detector is set to the specified energy (in eV),
@@ -192,17 +217,17 @@ class EigerDetector(Device):
         during the datacollection. The number of images is the number of images per
         trigger.
         """
-        assert self.detector_params is not None
-        status = self.cam.num_images.set(self.detector_params.num_images_per_trigger)
-        if self.detector_params.trigger_mode == TriggerMode.FREE_RUN:
+        params = self.params
+        status = self.cam.num_images.set(params.num_images_per_trigger)
+        if params.trigger_mode == TriggerMode.FREE_RUN:
             # The Eiger can't actually free run so we set a very large number of frames
             status &= self.cam.num_triggers.set(FREE_RUN_MAX_IMAGES)
             # Setting Odin to write 0 frames tells it to write until externally stopped
             status &= self.odin.file_writer.num_capture.set(0)
-        elif self.detector_params.trigger_mode == TriggerMode.SET_FRAMES:
-            status &= self.cam.num_triggers.set(self.detector_params.num_triggers)
+        elif params.trigger_mode == TriggerMode.SET_FRAMES:
+            status &= self.cam.num_triggers.set(params.num_triggers)
             status &= self.odin.file_writer.num_capture.set(
-                self.detector_params.full_number_of_images
+                params.full_number_of_images
             )
         return status
 
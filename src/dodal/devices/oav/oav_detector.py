@@ -1,3 +1,5 @@
+from typing import List, Optional
+
 from ophyd import ADComponent as ADC
 from ophyd import (
     AreaDetector,
@@ -34,9 +36,19 @@ class ZoomController(Device):
     frst: EpicsSignal = Component(EpicsSignal, "MP:SELECT.FRST")
     fvst: EpicsSignal = Component(EpicsSignal, "MP:SELECT.FVST")
 
+    # The zoom level strings are fixed once the IOC is up so are only read on first
+    # use, call refresh_allowed_zoom_levels to re-read them.
+    _allowed_zoom_levels: Optional[List[str]] = None
+
     @property
-    def allowed_zoom_levels(self):
-        return [
+    def allowed_zoom_levels(self) -> List[str]:
+        if self._allowed_zoom_levels is None:
+            self.refresh_allowed_zoom_levels()
+        assert self._allowed_zoom_levels is not None
+        return list(self._allowed_zoom_levels)
+
+    def refresh_allowed_zoom_levels(self):
+        self._allowed_zoom_levels = [
             self.zrst.get(),
             self.onst.get(),
             self.twst.get(),
@@ -1,12 +1,111 @@
-from typing import Any, TypeVar
+import threading
+from typing import Any, Callable, Optional, Tuple, TypeVar
 
-from ophyd.status import SubscriptionStatus
+from ophyd import Signal
+from ophyd.status import Status, StatusBase, SubscriptionStatus
+from ophyd.utils.errors import StatusTimeoutError, WaitTimeoutError
 
 T = TypeVar("T")
 
 
-def await_value(subscribable: Any, expected_value: T) -> SubscriptionStatus:
+def await_value(
+    subscribable: Any, expected_value: T, timeout: Optional[float] = None
+) -> SubscriptionStatus:
+    """Returns a status that is done when the subscribable reports the expected value.
+
+    This is driven by the subscribable's value callbacks (i.e. the CA monitor for an
+    EPICS signal) and does not poll, so it completes as soon as the value arrives. If a
+    timeout is given the status fails after it, which also removes the subscription.
+    """
+
     def value_is(value, **_):
         return value == expected_value
 
-    return SubscriptionStatus(subscribable, value_is)
+    return SubscriptionStatus(subscribable, value_is, timeout=timeout)
+
+
+def _reportable(exception: Exception) -> Exception:
+    """ophyd reserves its timeout errors for a status' own timeout, so another status
+    must report them as a plain TimeoutError."""
+    if isinstance(exception, (StatusTimeoutError, WaitTimeoutError)):
+        timeout_error = TimeoutError(str(exception))
+        timeout_error.__cause__ = exception
+        return timeout_error
+    return exception
+
+
+def set_all(*signals_and_values: Tuple[Signal, Any]) -> StatusBase:
+    """Dispatches a set for every (signal, value) pair before anything is waited on.
+
+    Returns:
+        A status that is done when all of the sets have completed.
+    """
+    return all_of(*(signal.set(value) for signal, value in signals_and_values))
+
+
+def run_after(first: StatusBase, start_next: Callable[[], StatusBase]) -> StatusBase:
+    """Starts the next operation once the first status has finished, without blocking.
+
+    Args:
+        first (StatusBase): The status of the operation that must finish first
+        start_next (Callable[[], StatusBase]): Starts the next operation, this is only
+            called if the first operation succeeds
+
+    Returns:
+        A status that is done when both operations have finished, or that fails as
+        soon as either of them fails.
+    """
+    chained_status = Status()
+
+    def finish(status: StatusBase):
+        exception = status.exception()
+        if exception is None:
+            chained_status.set_finished()
+        else:
+            chained_status.set_exception(_reportable(exception))
+
+    def start(status: StatusBase):
+        if status.exception() is not None:
+            finish(status)
+            return
+        try:
+            next_status = start_next()
+        except Exception as e:
+            chained_status.set_exception(e)
+            return
+        next_status.add_callback(finish)
+
+    first.add_callback(start)
+    return chained_status
+
+
+def all_of(*statuses: StatusBase) -> StatusBase:
+    """Combines any number of statuses into one, each of them reporting directly to
+    the combined status rather than through a chain of nested AndStatus objects.
+
+    Returns:
+        A status that is done when all of the statuses are done, or that fails as soon
+        as any of them fails.
+    """
+    combined_status = Status()
+    remaining = len(statuses)
+    lock = threading.Lock()
+
+    def on_done(status: StatusBase):
+        nonlocal remaining
+        exception = status.exception()
+        with lock:
+            if combined_status.done:
+                return
+            if exception is not None:
+                combined_status.set_exception(_reportable(exception))
+                return
+            remaining -= 1
+            if remaining == 0:
+                combined_status.set_finished()
+
+    if not statuses:
+        combined_status.set_finished()
+    for status in statuses:
+        status.add_callback(on_done)
+    return combined_status
@@ -1,4 +1,3 @@
-import bluesky.plan_stubs as bps
 import pytest
 from bluesky.run_engine import RunEngine
 
@@ -7,18 +6,18 @@ from dodal.devices.fast_grid_scan import (
     GridScanParams,
     set_fast_grid_scan_params,
 )
+from dodal.devices.status import all_of, await_value
 
 
 def wait_for_fgs_valid(fgs_motors: FastGridScan, timeout=0.5):
-    SLEEP_PER_CHECK = 0.1
-    times_to_check = int(timeout / SLEEP_PER_CHECK)
-    for _ in range(times_to_check):
-        scan_invalid = yield from bps.rd(fgs_motors.scan_invalid)
-        pos_counter = yield from bps.rd(fgs_motors.position_counter)
-        if not scan_invalid and pos_counter == 0:
-            return
-        yield from bps.sleep(SLEEP_PER_CHECK)
-    raise Exception(f"Scan parameters invalid after {timeout} seconds")
+    scan_valid = all_of(
+        await_value(fgs_motors.scan_invalid, 0, timeout),
+        await_value(fgs_motors.position_counter, 0, timeout),
+    )
+    try:
+        scan_valid.wait()
+    except TimeoutError as e:
+        raise Exception(f"Scan parameters invalid after {timeout} seconds") from e
 
 
 @pytest.fixture()
@@ -42,10 +41,6 @@ def test_when_program_data_set_and_staged_then_expected_images_correct(
 def test_given_valid_params_when_kickoff_then_completion_status_increases_and_finishes(
     fast_grid_scan: FastGridScan,
 ):
-    def set_and_wait_plan(fast_grid_scan: FastGridScan):
-        yield from set_fast_grid_scan_params(fast_grid_scan, GridScanParams(3, 3))
-        yield from wait_for_fgs_valid(fast_grid_scan)
-
     prev_current, prev_fraction = None, None
 
     def progress_watcher(*args, **kwargs):
@@ -61,7 +56,8 @@ def test_given_valid_params_when_kickoff_then_completion_status_increases_and_fi
                 assert 0 < prev_fraction < 1
 
     RE = RunEngine()
-    RE(set_and_wait_plan(fast_grid_scan))
+    RE(set_fast_grid_scan_params(fast_grid_scan, GridScanParams(3, 3)))
+    wait_for_fgs_valid(fast_grid_scan)
     assert fast_grid_scan.position_counter.get() == 0
 
     # S03 currently is giving 2* the number of expected images (see #13)
@@ -1,10 +1,15 @@
+from dataclasses import FrozenInstanceError
 from unittest.mock import MagicMock
 
 import pytest
 from ophyd.sim import make_fake_device
 from ophyd.status import Status, StatusBase
 
-from dodal.devices.aperturescatterguard import ApertureScatterguard, InvalidApertureMove
+from dodal.devices.aperturescatterguard import (
+    AperturePositions,
+    ApertureScatterguard,
+    InvalidApertureMove,
+)
 
 
 @pytest.fixture
@@ -47,3 +52,201 @@ def test_aperture_scatterguard_returns_status_if_within_tolerance(
         0, 0, 1, 0, 0
     )
     assert isinstance(status, StatusBase)
+
+
+def test_aperture_positions_only_accepts_known_positions():
+    positions = AperturePositions(
+        (0, 1, 2, 3, 4), (5, 6, 7, 8, 9), (10, 11, 12, 13, 14), (15, 16, 17, 18, 19)
+    )
+    assert positions.position_valid((5, 6, 7, 8, 9))
+    assert positions.position_valid(positions.ROBOT_LOAD)
+    assert not positions.position_valid((0, 1, 2, 3, 5))
+
+
+def test_aperture_moving_up_only_starts_after_scatterguard_move_has_finished(
+    fake_aperture_scatterguard: ApertureScatterguard,
+):
+    fake_aperture_scatterguard.aperture.z.motor_resolution.sim_put(0.001)
+    fake_aperture_scatterguard.aperture.z.user_setpoint.sim_put(1)
+    fake_aperture_scatterguard.aperture.z.motor_done_move.sim_put(1)
+    fake_aperture_scatterguard.aperture.y.user_readback.sim_put(0)
+
+    sg_status = Status()
+    fake_aperture_scatterguard.scatterguard.x.set = MagicMock(return_value=sg_status)
+    fake_aperture_scatterguard.scatterguard.y.set = MagicMock(
+        return_value=Status(done=True, success=True)
+    )
+    mock_ap_set = MagicMock(return_value=Status(done=True, success=True))
+    fake_aperture_scatterguard.aperture.x.set = mock_ap_set
+    fake_aperture_scatterguard.aperture.y.set = mock_ap_set
+    fake_aperture_scatterguard.aperture.z.set = mock_ap_set
+
+    status = fake_aperture_scatterguard._safe_move_within_datacollection_range(
+        0, 1, 1, 0, 0
+    )
+    assert not status.done
+    mock_ap_set.assert_not_called()
+
+    sg_status.set_finished()
+    status.wait(1)
+
+    assert status.success
+    assert mock_ap_set.call_count == 3
+
+
+def test_aperture_not_moved_if_scatterguard_move_fails(
+    fake_aperture_scatterguard: ApertureScatterguard,
+):
+    fake_aperture_scatterguard.aperture.z.motor_resolution.sim_put(0.001)
+    fake_aperture_scatterguard.aperture.z.user_setpoint.sim_put(1)
+    fake_aperture_scatterguard.aperture.z.motor_done_move.sim_put(1)
+    fake_aperture_scatterguard.aperture.y.user_readback.sim_put(0)
+
+    failed_status = Status()
+    failed_status.set_exception(Exception("Scatterguard failed to move"))
+    mock_sg_set = MagicMock(return_value=failed_status)
+    fake_aperture_scatterguard.scatterguard.x.set = mock_sg_set
+    fake_aperture_scatterguard.scatterguard.y.set = mock_sg_set
+    mock_ap_set = MagicMock()
+    fake_aperture_scatterguard.aperture.x.set = mock_ap_set
+    fake_aperture_scatterguard.aperture.y.set = mock_ap_set
+    fake_aperture_scatterguard.aperture.z.set = mock_ap_set
+
+    status = fake_aperture_scatterguard._safe_move_within_datacollection_range(
+        0, 1, 1, 0, 0
+    )
+
+    with pytest.raises(Exception):
+        status.wait(1)
+    mock_ap_set.assert_not_called()
+
+
+def test_aperture_positions_created_with_lists_stores_tuples():
+    positions = AperturePositions(
+        [0, 1, 2, 3, 4], [5, 6, 7, 8, 9], [10, 11, 12, 13, 14], [15, 16, 17, 18, 19]
+    )
+    assert positions.LARGE == (0, 1, 2, 3, 4)
+    assert positions.position_valid((15, 16, 17, 18, 19))
+
+
+def test_aperture_scatterguard_set_with_list_position_is_accepted(
+    fake_aperture_scatterguard: ApertureScatterguard,
+):
+    fake_aperture_scatterguard.load_aperture_positions(
+        AperturePositions(
+            (0, 1, 2, 3, 4), (5, 6, 7, 8, 9), (10, 11, 12, 13, 14), (15, 16, 17, 18, 19)
+        )
+    )
+    fake_aperture_scatterguard.aperture.z.motor_resolution.sim_put(0.001)
+    fake_aperture_scatterguard.aperture.z.user_setpoint.sim_put(2)
+    fake_aperture_scatterguard.aperture.z.motor_done_move.sim_put(1)
+
+    mock_set = MagicMock(return_value=Status(done=True, success=True))
+    fake_aperture_scatterguard.aperture.x.set = mock_set
+    fake_aperture_scatterguard.aperture.y.set = mock_set
+    fake_aperture_scatterguard.aperture.z.set = mock_set
+    fake_aperture_scatterguard.scatterguard.x.set = mock_set
+    fake_aperture_scatterguard.scatterguard.y.set = mock_set
+
+    status = fake_aperture_scatterguard.set([0, 1, 2, 3, 4])
+    status.wait(1)
+
+    assert status.success
+    assert mock_set.call_count == 5
+
+
+def test_aperture_positions_are_immutable_and_hashable():
+    positions = AperturePositions(
+        (0, 1, 2, 3, 4), (5, 6, 7, 8, 9), (10, 11, 12, 13, 14), (15, 16, 17, 18, 19)
+    )
+    same_positions = AperturePositions(
+        (0, 1, 2, 3, 4), (5, 6, 7, 8, 9), (10, 11, 12, 13, 14), (15, 16, 17, 18, 19)
+    )
+
+    with pytest.raises(FrozenInstanceError):
+        positions.LARGE = (1, 1, 1, 1, 1)  # type: ignore
+    assert {positions: "config"}[same_positions] == "config"
+
+
+def test_aperture_positions_created_from_gda_beamline_params():
+    params = {}
+    for position_number, suffix in enumerate(
+        ["LARGE_APERTURE", "MEDIUM_APERTURE", "SMALL_APERTURE", "ROBOT_LOAD"]
+    ):
+        for axis_number, axis in enumerate(
+            ["miniap_x", "miniap_y", "miniap_z", "sg_x", "sg_y"]
+        ):
+            params[f"{axis}_{suffix}"] = float(position_number * 5 + axis_number)
+
+    positions = AperturePositions.from_gda_beamline_params(params)
+
+    assert positions.LARGE == (0, 1, 2, 3, 4)
+    assert positions.MEDIUM == (5, 6, 7, 8, 9)
+    assert positions.SMALL == (10, 11, 12, 13, 14)
+    assert positions.ROBOT_LOAD == (15, 16, 17, 18, 19)
+
+
+def test_scatterguard_only_starts_after_aperture_moving_down_has_finished(
+    fake_aperture_scatterguard: ApertureScatterguard,
+):
+    fake_aperture_scatterguard.aperture.z.motor_resolution.sim_put(0.001)
+    fake_aperture_scatterguard.aperture.z.user_setpoint.sim_put(1)
+    fake_aperture_scatterguard.aperture.z.motor_done_move.sim_put(1)
+    fake_aperture_scatterguard.aperture.y.user_readback.sim_put(1)
+
+    ap_status = Status()
+    fake_aperture_scatterguard.aperture.x.set = MagicMock(return_value=ap_status)
+    fake_aperture_scatterguard.aperture.y.set = MagicMock(
+        return_value=Status(done=True, success=True)
+    )
+    fake_aperture_scatterguard.aperture.z.set = MagicMock(
+        return_value=Status(done=True, success=True)
+    )
+    mock_sg_set = MagicMock(return_value=Status(done=True, success=True))
+    fake_aperture_scatterguard.scatterguard.x.set = mock_sg_set
+    fake_aperture_scatterguard.scatterguard.y.set = mock_sg_set
+
+    status = fake_aperture_scatterguard._safe_move_within_datacollection_range(
+        0, 0, 1, 0, 0
+    )
+    assert not status.done
+    mock_sg_set.assert_not_called()
+
+    ap_status.set_finished()
+    status.wait(1)
+
+    assert status.success
+    assert mock_sg_set.call_count == 2
+
+
+def test_aperture_scatterguard_set_while_previous_move_in_progress_raises_invalid_move(
+    fake_aperture_scatterguard: ApertureScatterguard,
+):
+    positions = AperturePositions(
+        (0, 1, 2, 3, 4), (5, 6, 2, 8, 9), (10, 11, 2, 13, 14), (15, 16, 2, 18, 19)
+    )
+    fake_aperture_scatterguard.load_aperture_positions(positions)
+    fake_aperture_scatterguard.aperture.z.motor_resolution.sim_put(0.001)
+    fake_aperture_scatterguard.aperture.z.user_setpoint.sim_put(2)
+    fake_aperture_scatterguard.aperture.z.motor_done_move.sim_put(1)
+
+    sg_status = Status()
+    mock_sg_set = MagicMock(return_value=sg_status)
+    fake_aperture_scatterguard.scatterguard.x.set = mock_sg_set
+    fake_aperture_scatterguard.scatterguard.y.set = mock_sg_set
+    mock_ap_set = MagicMock(return_value=Status(done=True, success=True))
+    fake_aperture_scatterguard.aperture.x.set = mock_ap_set
+    fake_aperture_scatterguard.aperture.y.set = mock_ap_set
+    fake_aperture_scatterguard.aperture.z.set = mock_ap_set
+
+    status = fake_aperture_scatterguard.set(positions.SMALL)
+    with pytest.raises(InvalidApertureMove):
+        fake_aperture_scatterguard.set(positions.LARGE)
+    assert mock_sg_set.call_count == 2
+
+    sg_status.set_finished()
+    status.wait(1)
+    mock_ap_set.assert_any_call(10)
+
+    fake_aperture_scatterguard.set(positions.LARGE).wait(1)
+    mock_ap_set.assert_called_with(2)
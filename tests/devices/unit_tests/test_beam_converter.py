@@ -1,5 +1,9 @@
+import os
+from unittest.mock import MagicMock, patch
+
+import numpy as np
 import pytest
-from mockito import when
+from mockito import unstub, when
 
 from dodal.devices.det_dist_to_beam_converter import (
     Axis,
@@ -14,7 +18,8 @@ def fake_converter() -> DetectorDistanceToBeamXYConverter:
     when(DetectorDistanceToBeamXYConverter).parse_table().thenReturn(
         LOOKUP_TABLE_TEST_VALUES
     )
-    return DetectorDistanceToBeamXYConverter("test.txt")
+    yield DetectorDistanceToBeamXYConverter("test.txt")
+    unstub()
 
 
 @pytest.mark.parametrize(
@@ -82,3 +87,48 @@ def test_parse_table():
 
     assert test_converter.lookup_file == test_file
     assert test_converter.lookup_table_values == LOOKUP_TABLE_TEST_VALUES
+
+
+def write_lookup_table(path, rows):
+    with open(path, "w") as f:
+        f.write("Units det_dist beam_x beam_y\n")
+        f.writelines(f"{dist} {x} {y}\n" for dist, x, y in rows)
+
+
+@patch(
+    "dodal.devices.det_dist_to_beam_converter.loadtxt",
+    side_effect=np.loadtxt,
+)
+def test_lookup_table_only_read_once_per_file_until_reloaded(
+    mock_loadtxt: MagicMock, tmp_path
+):
+    test_file = str(tmp_path / "lookup_table.txt")
+    write_lookup_table(test_file, [(100.0, 150.0, 160.0), (200.0, 151.0, 165.0)])
+
+    DetectorDistanceToBeamXYConverter(test_file)
+    test_converter = DetectorDistanceToBeamXYConverter(test_file)
+    mock_loadtxt.assert_called_once()
+    assert test_converter.lookup_table_values == LOOKUP_TABLE_TEST_VALUES
+
+    test_converter.reload_lookup_table()
+    assert mock_loadtxt.call_count == 2
+
+
+def test_lookup_table_read_again_when_file_changed(tmp_path):
+    test_file = str(tmp_path / "lookup_table.txt")
+    write_lookup_table(test_file, [(100.0, 150.0, 160.0), (200.0, 151.0, 165.0)])
+    assert (
+        DetectorDistanceToBeamXYConverter(test_file).lookup_table_values
+        == LOOKUP_TABLE_TEST_VALUES
+    )
+
+    write_lookup_table(test_file, [(100.0, 50.0, 60.0), (200.0, 51.0, 65.0)])
+    # Make sure the change is seen even on filesystems with coarse timestamps
+    modified_time_ns = os.stat(test_file).st_mtime_ns + 1_000_000_000
+    os.utime(test_file, ns=(modified_time_ns, modified_time_ns))
+
+    assert DetectorDistanceToBeamXYConverter(test_file).lookup_table_values == [
+        (100.0, 200.0),
+        (50.0, 51.0),
+        (60.0, 65.0),
+    ]
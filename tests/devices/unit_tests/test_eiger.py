@@ -2,13 +2,13 @@ import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
-from mockito import ANY, mock, verify, when
 from ophyd.sim import make_fake_device
 from ophyd.status import Status
 
 from dodal.devices.det_dim_constants import EIGER2_X_16M_SIZE
 from dodal.devices.detector import DetectorParams, TriggerMode
 from dodal.devices.eiger import EigerDetector
+from dodal.devices.status import await_value
 
 TEST_DETECTOR_SIZE_CONSTANTS = EIGER2_X_16M_SIZE
 
@@ -44,15 +44,25 @@ def create_new_params() -> DetectorParams:
     )
 
 
+FakeEigerDetector = make_fake_device(EigerDetector)
+
+
 @pytest.fixture
 def fake_eiger():
-    FakeEigerDetector: EigerDetector = make_fake_device(EigerDetector)
     fake_eiger: EigerDetector = FakeEigerDetector.with_params(
         params=create_new_params(), name="test"
     )
     return fake_eiger
 
 
+@pytest.fixture
+def mock_await():
+    """Stands in for await_value so staging doesn't wait on values that the fake
+    Eiger will never report."""
+    with patch("dodal.devices.eiger.await_value") as mock_await:
+        yield mock_await
+
+
 @pytest.mark.parametrize(
     "current_energy, request_energy, is_energy_change",
     [
@@ -70,29 +80,28 @@ def test_detector_threshold(
     is_energy_change: bool,
 ):
     status_obj = MagicMock()
-    when(fake_eiger.cam.photon_energy).get().thenReturn(current_energy)
-    when(fake_eiger.cam.photon_energy).set(ANY).thenReturn(status_obj)
+    fake_eiger.cam.photon_energy.get = MagicMock(return_value=current_energy)
+    fake_eiger.cam.photon_energy.set = MagicMock(return_value=status_obj)
 
     returned_status = fake_eiger.set_detector_threshold(request_energy)
 
     if is_energy_change:
-        verify(fake_eiger.cam.photon_energy, times=1).set(request_energy)
+        fake_eiger.cam.photon_energy.set.assert_called_once_with(request_energy)
         assert returned_status == status_obj
     else:
-        verify(fake_eiger.cam.photon_energy, times=0).set(ANY)
-        returned_status.wait(0.1)
-        assert returned_status.success
+        fake_eiger.cam.photon_energy.set.assert_not_called()
+        assert returned_status.done and returned_status.success
 
 
 @pytest.mark.parametrize(
     "detector_params, detector_size_constants, beam_xy_converter, expected_error_number",
     [
-        (mock(), mock(), mock(), 0),
-        (None, mock(), mock(), 1),
-        (mock(), None, mock(), 1),
-        (None, None, mock(), 1),
+        (MagicMock(), MagicMock(), MagicMock(), 0),
+        (None, MagicMock(), MagicMock(), 1),
+        (MagicMock(), None, MagicMock(), 1),
+        (None, None, MagicMock(), 1),
         (None, None, None, 1),
-        (mock(), None, None, 2),
+        (MagicMock(), None, None, 2),
     ],
 )
 def test_check_detector_variables(
@@ -119,6 +128,14 @@ def test_check_detector_variables(
             assert False, f"exception was raised {e}"
 
 
+def test_given_no_detector_params_when_set_cam_pvs_then_exception_raised(
+    fake_eiger: EigerDetector,
+):
+    fake_eiger.detector_params = None
+    with pytest.raises(Exception, match="Parameters for scan must be specified"):
+        fake_eiger.set_cam_pvs()
+
+
 def test_when_set_odin_pvs_called_then_full_filename_written(fake_eiger: EigerDetector):
     expected_full_filename = f"{TEST_PREFIX}_{TEST_RUN_NUMBER}"
 
@@ -126,16 +143,32 @@ def test_when_set_odin_pvs_called_then_full_filename_written(fake_eiger: EigerDe
     # Logic for propagating filename is not in fake eiger
     fake_eiger.odin.meta.file_name.sim_put(expected_full_filename)
     fake_eiger.odin.file_writer.id.sim_put(expected_full_filename)
-    status.wait()
+    status.wait(1)
 
     assert fake_eiger.odin.file_writer.file_name.get() == expected_full_filename
 
 
+def test_when_set_mx_settings_pvs_called_then_all_values_written(
+    fake_eiger: EigerDetector,
+):
+    status = fake_eiger.set_mx_settings_pvs()
+    status.wait(1)
+
+    expected_beam_x, expected_beam_y = (
+        fake_eiger.detector_params.get_beam_position_pixels(TEST_DETECTOR_DISTANCE)
+    )
+    assert fake_eiger.cam.beam_center_x.get() == expected_beam_x
+    assert fake_eiger.cam.beam_center_y.get() == expected_beam_y
+    assert fake_eiger.cam.det_distance.get() == TEST_DETECTOR_DISTANCE
+    assert fake_eiger.cam.omega_start.get() == TEST_OMEGA_START
+    assert fake_eiger.cam.omega_incr.get() == TEST_OMEGA_INCREMENT
+
+
 def test_stage_raises_exception_if_odin_initialisation_status_not_ok(fake_eiger):
-    when(fake_eiger.odin.nodes).clear_odin_errors().thenReturn(None)
+    fake_eiger.odin.nodes.clear_odin_errors = MagicMock()
     expected_error_message = "Test error"
-    when(fake_eiger.odin).check_odin_initialised().thenReturn(
-        (False, expected_error_message)
+    fake_eiger.odin.check_odin_initialised = MagicMock(
+        return_value=(False, expected_error_message)
     )
     with pytest.raises(
         Exception, match=f"Odin not initialised: {expected_error_message}"
@@ -146,12 +179,12 @@ def test_stage_raises_exception_if_odin_initialisation_status_not_ok(fake_eiger)
 @pytest.mark.parametrize(
     "roi_mode, expected_num_roi_enable_calls", [(True, 1), (False, 0)]
 )
-@patch("dodal.devices.eiger.await_value")
+@pytest.mark.usefixtures("mock_await")
 def test_stage_enables_roi_mode_correctly(
-    mock_await, fake_eiger, roi_mode, expected_num_roi_enable_calls
+    fake_eiger, roi_mode, expected_num_roi_enable_calls
 ):
-    when(fake_eiger.odin.nodes).clear_odin_errors().thenReturn(None)
-    when(fake_eiger.odin).check_odin_initialised().thenReturn((True, ""))
+    fake_eiger.odin.nodes.clear_odin_errors = MagicMock()
+    fake_eiger.odin.check_odin_initialised = MagicMock(return_value=(True, ""))
 
     fake_eiger.detector_params.use_roi_mode = roi_mode
 
@@ -186,8 +219,8 @@ def test_disable_roi_mode_sets_correct_roi_mode(fake_eiger):
 def test_change_roi_mode_sets_correct_detector_size_constants(
     fake_eiger, roi_mode, expected_detector_dimensions
 ):
-    mock_odin_height_set = MagicMock()
-    mock_odin_width_set = MagicMock()
+    mock_odin_height_set = MagicMock(return_value=Status(done=True, success=True))
+    mock_odin_width_set = MagicMock(return_value=Status(done=True, success=True))
     fake_eiger.odin.file_writer.image_height.set = mock_odin_height_set
     fake_eiger.odin.file_writer.image_width.set = mock_odin_width_set
 
@@ -202,17 +235,17 @@ def test_change_roi_mode_sets_correct_detector_size_constants(
 def test_change_roi_mode_sets_cam_roi_mode_correctly(
     fake_eiger, roi_mode, expected_cam_roi_mode_call
 ):
-    mock_cam_roi_mode_set = MagicMock()
+    mock_cam_roi_mode_set = MagicMock(return_value=Status(done=True, success=True))
     fake_eiger.cam.roi_mode.set = mock_cam_roi_mode_set
     fake_eiger.change_roi_mode(roi_mode)
     mock_cam_roi_mode_set.assert_called_once_with(expected_cam_roi_mode_call)
 
 
-@patch("ophyd.status.Status.__and__")
-def test_unsuccessful_roi_mode_change_results_in_logged_error(mock_and, fake_eiger):
+@patch("dodal.devices.eiger.set_all")
+def test_unsuccessful_roi_mode_change_results_in_logged_error(mock_set_all, fake_eiger):
     dummy_status = Status()
     dummy_status.wait = MagicMock()
-    mock_and.return_value = dummy_status
+    mock_set_all.return_value = dummy_status
 
     fake_eiger.log.error = MagicMock()
     fake_eiger.change_roi_mode(True)
@@ -241,8 +274,8 @@ def test_given_failing_odin_when_stage_then_exception_raised(fake_eiger):
         assert error_contents in e.value
 
 
-@patch("dodal.devices.eiger.await_value")
-def test_stage_runs_successfully(mock_await, fake_eiger: EigerDetector):
+@pytest.mark.usefixtures("mock_await")
+def test_stage_runs_successfully(fake_eiger: EigerDetector):
     fake_eiger.odin.nodes.clear_odin_errors = MagicMock()
     fake_eiger.odin.check_odin_initialised = MagicMock()
     fake_eiger.odin.check_odin_initialised.return_value = (True, "")
@@ -250,7 +283,6 @@ def test_stage_runs_successfully(mock_await, fake_eiger: EigerDetector):
     fake_eiger.stage()
 
 
-@patch("dodal.devices.eiger.await_value")
 def test_given_stale_parameters_goes_high_before_callbacks_then_stale_parameters_waited_on(
     mock_await,
     fake_eiger: EigerDetector,
@@ -260,6 +292,15 @@ def test_given_stale_parameters_goes_high_before_callbacks_then_stale_parameters
     fake_eiger.odin.check_odin_initialised.return_value = (True, "")
     fake_eiger.odin.file_writer.file_path.put(True)
 
+    # Only the stale parameters are really waited on, so that staging can only finish
+    # once they have gone low
+    def await_only_stale_params(signal, value):
+        if signal is fake_eiger.stale_params:
+            return await_value(signal, value)
+        return MagicMock()
+
+    mock_await.side_effect = await_only_stale_params
+
     def wait_on_staging():
         fake_eiger.stage()
 
@@ -278,13 +319,13 @@ def test_given_stale_parameters_goes_high_before_callbacks_then_stale_parameters
 
     fake_eiger.stale_params.sim_put(0)
 
-    thread.join(0.2)
+    # Generous timeout that is only hit if staging has hung
+    thread.join(5)
     assert not thread.is_alive()
 
 
-@patch("dodal.devices.eiger.await_value")
+@pytest.mark.usefixtures("mock_await")
 def test_given_in_free_run_mode_when_staged_then_triggers_and_filewriter_set_correctly(
-    mock_await,
     fake_eiger: EigerDetector,
 ):
     fake_eiger.odin.nodes.clear_odin_errors = MagicMock()
@@ -100,3 +100,26 @@ def test_bottom_right_from_top_left():
         top_left, 15, 20, 0.005, 0.007, 1, 1
     )
     assert bottom_right.x == 198 and bottom_right.y == 263
+
+
+def test_allowed_zoom_levels_only_read_again_when_refreshed(fake_oav: OAV):
+    zoom_controller = fake_oav.zoom_controller
+    zoom_controller.zrst.sim_put("1.0x")
+    assert zoom_controller.allowed_zoom_levels[0] == "1.0x"
+
+    zoom_controller.zrst.sim_put("2.0x")
+    assert zoom_controller.allowed_zoom_levels[0] == "1.0x"
+
+    zoom_controller.refresh_allowed_zoom_levels()
+    assert zoom_controller.allowed_zoom_levels[0] == "2.0x"
+
+
+def test_changing_returned_allowed_zoom_levels_does_not_change_cached_levels(
+    fake_oav: OAV,
+):
+    zoom_controller = fake_oav.zoom_controller
+    zoom_controller.zrst.sim_put("1.0x")
+
+    zoom_controller.allowed_zoom_levels[0] = "2.0x"
+
+    assert zoom_controller.allowed_zoom_levels[0] == "1.0x"
@@ -0,0 +1,92 @@
+from unittest.mock import MagicMock
+
+import pytest
+from ophyd import Signal
+from ophyd.status import Status
+
+from dodal.devices.status import all_of, await_value, run_after, set_all
+
+
+def test_all_of_finishes_only_when_every_status_finished():
+    statuses = [Status(), Status(), Status()]
+    combined = all_of(*statuses)
+
+    for status in statuses[:-1]:
+        status.set_finished()
+        assert not combined.done
+
+    statuses[-1].set_finished()
+    combined.wait(1)
+    assert combined.success
+
+
+def test_all_of_fails_when_any_status_fails():
+    statuses = [Status(), Status()]
+    combined = all_of(*statuses)
+
+    statuses[0].set_exception(Exception("Test failure"))
+
+    with pytest.raises(Exception, match="Test failure"):
+        combined.wait(1)
+
+
+def test_all_of_fails_with_timeout_error_when_any_status_times_out():
+    combined = all_of(Status(timeout=0.01), Status())
+
+    with pytest.raises(TimeoutError):
+        combined.wait(1)
+
+
+def test_all_of_with_no_statuses_is_finished():
+    assert all_of().done
+
+
+def test_set_all_with_no_signals_is_finished():
+    assert set_all().done
+
+
+def test_run_after_only_starts_next_when_first_finished():
+    first = Status()
+    start_next = MagicMock(return_value=Status(done=True, success=True))
+
+    chained = run_after(first, start_next)
+    start_next.assert_not_called()
+    assert not chained.done
+
+    first.set_finished()
+    chained.wait(1)
+
+    start_next.assert_called_once()
+    assert chained.success
+
+
+def test_run_after_does_not_start_next_if_first_fails():
+    first = Status()
+    start_next = MagicMock()
+
+    chained = run_after(first, start_next)
+    first.set_exception(Exception("Test failure"))
+
+    with pytest.raises(Exception, match="Test failure"):
+        chained.wait(1)
+    start_next.assert_not_called()
+
+
+def test_run_after_fails_with_timeout_error_when_first_times_out():
+    start_next = MagicMock()
+
+    chained = run_after(Status(timeout=0.01), start_next)
+
+    with pytest.raises(TimeoutError):
+        chained.wait(1)
+    start_next.assert_not_called()
+
+
+def test_await_value_with_timeout_fails_and_unsubscribes_if_value_never_arrives():
+    signal = Signal(name="signal", value=0)
+
+    status = await_value(signal, 1, timeout=0.01)
+
+    with pytest.raises(TimeoutError):
+        status.wait(1)
+    assert not signal._callbacks[signal.SUB_VALUE]